@@ -3,14 +3,16 @@ Entry point for zabob-houdini CLI and hython dispatch.
 """
 
 import click
-import json
+import os
+import signal
 import sys
+from types import FrameType
 
 
 from zabob_houdini.cli import main as dev_main, diagnostics, info
 from zabob_houdini.__version__ import __version__, __distribution__
 from zabob_houdini.houdini_bridge import invoke_houdini_function
-from zabob_houdini.utils import write_error_result, write_response
+from zabob_houdini.utils import error_result, read_frame, write_frame, write_response
 
 IN_HOUDINI: bool = 'hou' in sys.modules
 
@@ -40,9 +42,7 @@ if IN_HOUDINI:
         to execute functions within the Houdini Python environment.
         """
         with invoke_houdini_function(module_name, function_name, args) as result:
-            json.dump(result, sys.stdout)
-            sys.stdout.write('\n')
-            sys.stdout.flush()
+            write_response(result)
             if not result["success"]:
                 sys.exit(1)
 
@@ -52,33 +52,52 @@ if IN_HOUDINI:
         """
         Internal batch executor for multiple hython function calls.
 
-        Reads JSON lines from stdin, each containing:
+        Reads length-prefixed JSON frames (see `utils.read_frame`) from stdin, each containing:
         {"module": "module_name", "function": "function_name", "args": ["arg1", "arg2"]}
 
-        Outputs one JSON result per line to stdout.
+        Writes one framed JSON result per request to stdout.
         """
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-
+        requests = sys.stdin.buffer
+        responses = sys.stdout.buffer
+        # The framed stream owns stdout; send anything the called functions print to stderr.
+        sys.stdout = sys.stderr
+
+        def exit_on_sigterm(signum: int, frame: FrameType | None) -> None:
+            # Every response is flushed as it is written, so there is nothing to lose.
+            # Skip interpreter teardown, which can take seconds with Houdini loaded.
+            sys.stderr.flush()
+            os._exit(0)
+        signal.signal(signal.SIGTERM, exit_on_sigterm)
+
+        # Load the core API (and resolve ROOT) now, so the first request isn't slower than the rest.
+        try:
+            import zabob_houdini.core  # noqa: F401
+        except Exception:
+            pass  # Each request retries the import and reports the failure as an error_result
+
+        while True:
             try:
-                request = json.loads(line)
-            except json.JSONDecodeError as e:
-                write_error_result(f'Invalid JSON in request: {e}')
+                request = read_frame(requests)
+            except ValueError as e:
+                # Undecodable UTF-8 or JSON; the framing is intact, so carry on.
+                write_frame(responses, error_result(f'Invalid JSON in request: {e}'))
                 continue
-            if 'module' not in request or 'function' not in request:
-                write_error_result(f'Missing "module" or "function" field in JSON request: {request}')
+            if request is None:
+                break
+            if not isinstance(request, dict) or 'module' not in request or 'function' not in request:
+                write_frame(responses, error_result(
+                    f'Missing "module" or "function" field in JSON request: {request}'))
                 continue
             module_name = request['module']
             function_name = request['function']
             args = request.get('args', [])
             if not isinstance(args, list):
-                write_error_result(f'"args" field must be a list, got {type(args).__name__}')
+                write_frame(responses, error_result(
+                    f'"args" field must be a list, got {type(args).__name__}'))
                 continue
 
             with invoke_houdini_function(module_name, function_name, args) as result:
-                write_response(result)
+                write_frame(responses, result)
 
     # Add the hidden commands to the existing CLI when module is imported
     main.add_command(_exec)
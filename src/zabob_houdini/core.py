@@ -429,6 +429,15 @@ class NodeInstance(NodeBase):
                           _render=_render,
         )
 
+    def __copy__(self) -> 'NodeInstance':
+        """Make copy.copy() equivalent to copy(), rather than cloning created-node state."""
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'NodeInstance':
+        """Make copy.deepcopy() equivalent to copy(); attributes and input nodes are shared, not copied."""
+        memo[id(self)] = result = self.copy()
+        return result
+
 
     def _copy(self, /,
              _inputs: InputNodes = (),
@@ -526,6 +535,15 @@ class Chain(NodeBase):
             return tuple()
         return self.first.inputs
 
+    @functools.cached_property
+    def _nodes_by_name(self) -> dict[str, NodeInstance]:
+        """Index of the nodes by name, for name lookups. The first node wins if names repeat."""
+        by_name: dict[str, NodeInstance] = {}
+        for node_instance in self.nodes:
+            if node_instance.name is not None:
+                by_name.setdefault(node_instance.name, node_instance)
+        return by_name
+
     @overload
     def __getitem__(self, key: int) -> NodeInstance: ...
 
@@ -558,10 +576,10 @@ class Chain(NodeBase):
                 )
             case str() as name:
                 # Find node by name
-                for node_instance in nodes:
-                    if node_instance.name == name:
-                        return node_instance
-                raise KeyError(f"No node found with name '{name}'")
+                try:
+                    return self._nodes_by_name[name]
+                except KeyError:
+                    raise KeyError(f"No node found with name '{name}'") from None
             case _:
                 raise TypeError(f"Chain indices must be integers, slices, or strings, not {type(key).__name__}")
 
@@ -732,6 +750,16 @@ class Chain(NodeBase):
         )
         return new_chain
 
+    def __copy__(self) -> 'Chain':
+        """Make copy.copy() equivalent to copy(), rather than cloning created-node state."""
+        # copy() refuses to produce an empty chain, but copying an empty chain is fine.
+        return self.copy() if self.nodes else Chain(nodes=())
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> 'Chain':
+        """Make copy.deepcopy() equivalent to copy(), which already copies every node."""
+        memo[id(self)] = result = self.__copy__()
+        return result
+
 
 def node(
     parent: NodeParent,
@@ -44,8 +44,6 @@ import sys
 from pathlib import Path
 from typing import Any, ParamSpec, cast
 
-import click
-
 from zabob_houdini.utils import (
     JsonValue, HoudiniResult, error_result, _is_houdini_result
 )
@@ -61,8 +59,14 @@ def _is_in_houdini() -> bool:
     return 'hou' in sys.modules
 
 
+@functools.cache
 def _find_hython() -> Path:
-    """Find hython executable."""
+    """
+    Find hython executable.
+
+    The PATH search is done once per process. A failed search is not cached,
+    so hython added to the PATH later will still be found.
+    """
     loc = shutil.which("hython")
     if loc is not None:
         return Path(loc)
@@ -155,6 +159,10 @@ def houdini_command(fn: Callable[P, None]) -> Callable[P, None]:
     Returns:
         Decorated function that invokes hython if needed.
     """
+    # Deferred so that importing the bridge (e.g. to call call_houdini_function
+    # from library code or inside hython) does not pull in click.
+    import click
+
     @functools.wraps(fn)
     @click.pass_context
     def wrapper(ctx: click.Context, *args: P.args, **kwargs: P.kwargs) -> None:
@@ -34,6 +34,7 @@ The decorators handle:
 - JSON serialization compatibility
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
@@ -96,12 +97,23 @@ def create_test_chain() -> str:
     return f"Chain created successfully: {len(result)} nodes"
 
 
+@functools.cache
+def houdini_version() -> tuple[int, int, int]:
+    """
+    Get the running Houdini version.
+
+    The version cannot change for the life of the process, so it is only
+    queried once; the persistent `_batch_exec` worker asks for it repeatedly.
+    """
+    return hou.applicationVersion()
+
+
 def get_houdini_info() -> JsonObject:
     """Get Houdini environment information."""
     try:
         return {
             'houdini_app': hou.applicationName(),
-            'houdini_version': list(hou.applicationVersion()),
+            'houdini_version': list(houdini_version()),
             'houdini_build': hou.applicationVersionString(),
             "hython_version": sys.version,
             "houdini_environment": dict(os.environ),
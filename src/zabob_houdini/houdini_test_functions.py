@@ -37,6 +37,7 @@ from zabob_houdini.core import (
     ROOT, Inputs, NodeInstance, get_node_instance,
     hou_node, node, chain, wrap_node, _merge_inputs
 )
+from zabob_houdini.houdini_functions import houdini_version
 from zabob_houdini.utils import JsonObject, JsonArray
 
 
@@ -225,6 +226,17 @@ def test_chain_convenience_methods() -> JsonObject:
     all_nodes_length = len(all_nodes)
     nodes_iter_length = len(nodes_list)
 
+    # Repeated calls should reuse the cached creation
+    created = test_chain.create()
+    create_cached = test_chain.create() is created
+    created_are_chain_nodes = all(a is b for a, b in zip(created, test_chain.nodes))
+    first_node_cached = test_chain.first_node() is first
+
+    # A single-node chain has the same first and last node
+    single_chain = chain(node(geo.path(), "box", name="only_box"))
+    single_first = single_chain.first_node()
+    single_last = single_chain.last_node()
+
     return {
         'first_path': first.path(),
         'last_path': last.path(),
@@ -232,6 +244,12 @@ def test_chain_convenience_methods() -> JsonObject:
         'all_nodes_length': all_nodes_length,
         'nodes_iter_length': nodes_iter_length,
         'all_nodes_paths': [node.path() for node in all_nodes],
+        'create_cached': create_cached,
+        'created_are_chain_nodes': created_are_chain_nodes,
+        'first_node_cached': first_node_cached,
+        'single_first_is_last': single_first is single_last,
+        'single_all_nodes_length': len(single_chain.hou_nodes()),
+        'single_path': single_first.path(),
     }
 
 
@@ -511,7 +529,7 @@ def test_node_registry() -> JsonObject:
 
 def test_hou_available() -> JsonObject:
     """Simple test to verify hou module is available."""
-    version = hou.applicationVersion()
+    version = houdini_version()
     app_name = hou.applicationName()
 
     return {
@@ -1328,3 +1346,78 @@ def test_chain_positional_reordering():
         'mixed_names': [n.name for n in mixed_chain],
         'inserted_names': [n.name for n in inserted_chain],
     }
+
+
+def test_chain_indexing() -> JsonObject:
+    """Test Chain indexing by integer, slice, and name."""
+    geo = node("/obj", "geo")
+    test_chain = chain(
+        node(geo, "box", name="source"),
+        node(geo, "xform", name="transform"),
+        node(geo, "subdivide", name="refine"),
+    )
+    repeated_chain = chain(
+        node(geo, "box", name="twin"),
+        node(geo, "sphere", name="twin"),
+    )
+
+    missing_name_error = None
+    try:
+        test_chain["missing"]
+    except KeyError as e:
+        missing_name_error = str(e)
+
+    invalid_key_error = None
+    try:
+        test_chain[1.5]  # type: ignore[call-overload]
+    except TypeError as e:
+        invalid_key_error = str(e)
+
+    return {
+        'index_names': {str(i): test_chain[i].name for i in (0, 1, 2, -1)},
+        'name_types': {name: test_chain[name].node_type for name in ('source', 'transform', 'refine')},
+        'name_matches_index': test_chain['transform'] is test_chain[1],
+        'slice_names': [n.name for n in test_chain[1:]],
+        'repeated_name_is_first': repeated_chain['twin'] is repeated_chain[0],
+        'missing_name_error': missing_name_error,
+        'invalid_key_error': invalid_key_error,
+    }
+
+
+def test_copy_module_protocol() -> JsonObject:
+    """Test copy.copy() and copy.deepcopy() on NodeInstance and Chain."""
+    import copy
+
+    geo = node("/obj", "geo")
+    original_node = node(geo, "box", name="proto_box", sizex=2.0)
+    original_chain = chain(node(geo, "box", name="proto_first"), node(geo, "xform", name="proto_second"))
+    original_first_path = original_chain.first_node().path()
+
+    # A wrapped hou.Node carries the node in _node; copies must not
+    raw_node = hou_node("/obj").createNode("geo", "proto_raw")
+    wrapped = wrap_node(raw_node)
+
+    shallow_node = copy.copy(original_node)
+    deep_node = copy.deepcopy(original_node)
+    shallow_chain = copy.copy(original_chain)
+    deep_chain = copy.deepcopy(original_chain)
+    empty_chain_copy = copy.copy(chain())
+
+    return {
+        'node_copies_independent': shallow_node is not original_node and deep_node is not original_node,
+        'node_copies_same_name': shallow_node.name == deep_node.name == original_node.name,
+        'node_copies_same_attributes': shallow_node.attributes == deep_node.attributes == original_node.attributes,
+        'chain_copies_independent': shallow_chain is not original_chain and deep_chain is not original_chain,
+        'chain_nodes_copied': all(
+            a is not b and a is not c
+            for a, b, c in zip(original_chain.nodes, shallow_chain.nodes, deep_chain.nodes)
+        ),
+        'chain_names': [n.name for n in deep_chain],
+        'chain_nodes_rebound': all(n._chain is deep_chain for n in deep_chain.nodes),
+        # Creating a copy makes new Houdini nodes rather than reusing the original's
+        'shallow_chain_creates_new_nodes': shallow_chain.first_node().path() != original_first_path,
+        'deep_chain_creates_new_nodes': deep_chain.first_node().path() != original_first_path,
+        'wrapped_has_node': wrapped._node is raw_node,
+        'wrapped_copies_drop_node': copy.copy(wrapped)._node is None and copy.deepcopy(wrapped)._node is None,
+        'empty_chain_copy_length': len(empty_chain_copy),
+    }
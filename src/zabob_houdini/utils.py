@@ -2,18 +2,21 @@
 Utility functions and types.
 '''
 
-from typing import NotRequired, TypeAlias, TypedDict, Any
+from __future__ import annotations
+
+from typing import IO, NotRequired, TypeAlias, TypedDict, Any
 import json
+import struct
 import sys
 
 
 JsonAtomicValue: TypeAlias = str | int | float | bool | None
 '''An atomic JSON value, such as a string, number, boolean, or null.'''
-JsonArray: TypeAlias = 'list[JsonValue]'
+JsonArray: TypeAlias = list['JsonValue']
 '''A JSON array, which is a list of JSON values.'''
-JsonObject: TypeAlias = 'dict[str, JsonValue]'
+JsonObject: TypeAlias = dict[str, 'JsonValue']
 '''A JSON object, which is a dictionary with string keys and JSON values.'''
-JsonValue: TypeAlias = 'JsonAtomicValue | JsonArray | JsonObject'
+JsonValue: TypeAlias = JsonAtomicValue | JsonArray | JsonObject
 '''A JSON value, which can be an atomic value, array, or object.'''
 
 
@@ -40,12 +43,69 @@ def write_response(result: HoudiniResult) -> None:
     sys.stdout.flush()
 
 
-def write_error_result(message: str) -> None:
-    """Helper to write an error result to stdout."""
-    error_response = error_result(message)
-    json.dump(error_response, sys.stdout)
-    sys.stdout.write('\n')
-    sys.stdout.flush()
+FRAME_HEADER = struct.Struct('>I')
+'''Header for framed messages: the payload length as a 4-byte big-endian integer.'''
+
+
+def encode_frame(message: Any) -> bytes:
+    """
+    Encode a message as a length-prefixed JSON frame.
+
+    Used for the persistent `_batch_exec` protocol, so the reader can take
+    exactly one message without scanning for a delimiter.
+    """
+    payload = json.dumps(message).encode('utf-8')
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+
+def write_frame(stream: IO[bytes], message: Any) -> None:
+    """Write a message to a binary stream as a length-prefixed JSON frame."""
+    write_encoded(stream, encode_frame(message))
+
+
+def write_encoded(stream: IO[bytes], data: bytes) -> None:
+    """Write one or more already-encoded frames (see `encode_frame`) and flush."""
+    view = memoryview(data)
+    # Unbuffered streams may accept only part of a write.
+    while view:
+        view = view[stream.write(view):]
+    stream.flush()
+
+
+def read_frame(stream: IO[bytes]) -> Any:
+    """
+    Read one length-prefixed JSON frame from a binary stream.
+
+    Returns:
+        The decoded message, or None if the stream is at end of file.
+
+    Raises:
+        EOFError: If the stream ends partway through a frame.
+        ValueError: If the payload is not valid UTF-8 (UnicodeDecodeError) or
+            not valid JSON (json.JSONDecodeError). The stream is still
+            positioned at the next frame.
+    """
+    header = _read_exact(stream, FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < FRAME_HEADER.size:
+        raise EOFError(f"Stream ended after {len(header)} of {FRAME_HEADER.size} header bytes")
+    (size,) = FRAME_HEADER.unpack(header)
+    payload = _read_exact(stream, size)
+    if len(payload) < size:
+        raise EOFError(f"Stream ended after {len(payload)} of {size} payload bytes")
+    return json.loads(payload)
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes:
+    """Read `size` bytes, returning fewer only at end of file."""
+    data = stream.read(size)
+    while data and len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
 
 
 def _is_houdini_result(result: Any) -> bool:
@@ -4,26 +4,63 @@ Safe pytest fixtures for Houdini testing.
 This version avoids importing anything that could trigger hou imports.
 """
 
-from collections.abc import Generator
-from typing import Protocol
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from typing import IO, Protocol
 from threading import RLock
+import functools
 import pytest
 from pathlib import Path
 import sys
 import subprocess
-import json
 import shutil
 
-from zabob_houdini.utils import JsonValue, HoudiniResult
+from zabob_houdini.utils import JsonValue, HoudiniResult, encode_frame, read_frame, write_encoded
+
+
+_TEST_MODULE = "houdini_test_functions"
+"""Module (within zabob_houdini) that hython test functions are looked up in by default."""
+
+_HOUDINI_AVAILABLE: bool = any(
+    name in Path(sys.executable).name.lower() for name in ('hython', 'houdini')
+)
+"""Whether this test process itself is running under hython/Houdini."""
 
 
 class HythonSessionFn(Protocol):
     """A function that can be called to execute a function in the hython environment."""
     def __call__(self, test_func_name: str, *args: JsonValue,
-                 module: str = "houdini_test_functions") -> HoudiniResult: ...
+                 module: str = _TEST_MODULE) -> HoudiniResult: ...
+
+
+class HythonBatchFn(Protocol):
+    """A function that executes several functions in the hython environment in one round-trip."""
+    def __call__(self, calls: Sequence[tuple[str, Sequence[JsonValue]]],
+                 module: str = _TEST_MODULE) -> list[HoudiniResult]: ...
+
+
+@contextmanager
+def _hython_session_errors() -> Generator[None, None, None]:
+    """Skip the test if hython can't be started; fail it on other session errors."""
+    try:
+        yield
+    except RuntimeError as e:
+        if "Could not start hython" in str(e):
+            pytest.skip("hython not found - Houdini not installed or not in PATH")
+        else:
+            pytest.fail(f"Hython session error: {e}")
 
 
-@pytest.fixture
+def _check_result(result: HoudiniResult) -> HoudiniResult:
+    """Fail the test if the hython function reported an error."""
+    if not result['success']:
+        error_msg = result.get("error", "Unknown error")
+        traceback_info = result.get("traceback", "")
+        pytest.fail(f"Houdini test failed: {error_msg}\n{traceback_info}")
+    return result
+
+
+@pytest.fixture(scope="session")
 def hython_test(hython_session: 'HythonSession') -> HythonSessionFn:
     """
     Fixture that provides a function to run test functions in hython.
@@ -31,39 +68,62 @@ def hython_test(hython_session: 'HythonSession') -> HythonSessionFn:
     Uses persistent hython session that starts on first use.
     """
     def run_houdini_test(test_func_name: str, *args: JsonValue,
-                         module: str = "houdini_test_functions") -> HoudiniResult:
+                         module: str = _TEST_MODULE) -> HoudiniResult:
         """Run a test function in hython and validate the result."""
-        try:
+        with _hython_session_errors():
             result = hython_session.call_function(test_func_name, *args,
                                             module=module)
-        except RuntimeError as e:
-            if "Could not start hython" in str(e):
-                pytest.skip("hython not found - Houdini not installed or not in PATH")
-            else:
-                pytest.fail(f"Hython session error: {e}")
-        except Exception as e:
-            pytest.fail(f"Hython call failed: {e}")
-
-        # Validate the result structure
-        if not result['success']:
-            error_msg = result.get("error", "Unknown error")
-            traceback_info = result.get("traceback", "")
-            pytest.fail(f"Houdini test failed: {error_msg}\n{traceback_info}")
-
-        return result
+        return _check_result(result)
 
     return run_houdini_test
 
 
+@pytest.fixture(scope="session")
+def hython_batch(hython_session: 'HythonSession') -> HythonBatchFn:
+    """
+    Fixture that provides a function to run several test functions in hython at once.
+
+    The requests are pipelined over the persistent session (see
+    `HythonSession.call_many`), and results come back in call order.
+    """
+    def run_houdini_tests(calls: Sequence[tuple[str, Sequence[JsonValue]]],
+                          module: str = _TEST_MODULE) -> list[HoudiniResult]:
+        """Run test functions in hython and validate each result."""
+        with _hython_session_errors():
+            results = hython_session.call_many(calls, module=module)
+        return [_check_result(result) for result in results]
+
+    return run_houdini_tests
+
+
+_PIPE_SIZE = 1 << 20
+"""Kernel buffer size requested for the hython pipes (the default is 64 KiB)."""
+
+
+def _enlarge_pipe(stream: IO[bytes]) -> None:
+    """Raise the kernel buffer size of a pipe. Linux only; best effort."""
+    import fcntl
+    try:
+        fcntl.fcntl(stream.fileno(), fcntl.F_SETPIPE_SZ, _PIPE_SIZE)
+    except OSError:
+        pass  # Over /proc/sys/fs/pipe-max-size; keep the default
+
+
 class HythonSession:
     """Manages a persistent hython process for the test session."""
-    process: subprocess.Popen | None = None
+    process: subprocess.Popen[bytes] | None = None
     _started: bool = False
     lock: RLock
 
     def __init__(self):
         self.lock = RLock()
 
+    @staticmethod
+    @functools.cache
+    def _find_hython() -> str | None:
+        """Locate hython once per test run; restarts and skips reuse the answer."""
+        return shutil.which("hython")
+
     def _ensure_started(self) -> bool:
         """Start the hython process if not already started."""
         with self.lock:
@@ -73,7 +133,7 @@ class HythonSession:
                 # Process died, reset state
                 self._started = False
                 self.process = None
-            hython_path = shutil.which("hython")
+            hython_path = self._find_hython()
             if not hython_path:
                 return False
             retries = 3
@@ -85,8 +145,9 @@ class HythonSession:
                         stdout=subprocess.PIPE,
                         # Pass stderr through for transparency in case of errors
                         stderr=None,
-                        text=True,
-                        bufsize=1  # Line buffered
+                        # Unbuffered, so select() sees every response that is
+                        # waiting, even when several are in flight.
+                        bufsize=0,
                     )
                     if (self.process.poll() is None
                         and self.process.stdout
@@ -94,24 +155,45 @@ class HythonSession:
                         and not self.process.stdout.closed
                         and not self.process.stdin.closed
                         ):
+                            if sys.platform == "linux":
+                                _enlarge_pipe(self.process.stdin)
+                                _enlarge_pipe(self.process.stdout)
                             self._started = True
                             return True
                 except Exception:
                     pass # Ignore exceptions and retry
             return False
 
-    def call_function(self, func_name: str, *args, module: str = "houdini_test_functions") -> HoudiniResult:
+    def call_function(self, func_name: str, *args, module: str = _TEST_MODULE) -> HoudiniResult:
         """
         Call a function in the persistent hython process.
 
         Args:
             func_name: Name of the function to call in the specified module.
-            args: Arguments to pass to the function.
+            args: JSON-serializable arguments, passed to the function as-is.
             module: Module name where the function is defined (default "houdini_test_functions").
 
         Returns:
             A dictionary with the result of the function call, including success status and any returned data.
         """
+        return self.call_many([(func_name, args)], module=module)[0]
+
+    def call_many(self, calls: Sequence[tuple[str, Sequence[JsonValue]]],
+                  module: str = _TEST_MODULE) -> list[HoudiniResult]:
+        """
+        Call several functions in the persistent hython process in one round-trip.
+
+        All requests are written before any response is read; the worker answers
+        them in order. Batches should stay small enough that the requests fit in
+        the pipe buffer, or the write can stall behind unread responses.
+
+        Args:
+            calls: (function name, JSON-serializable arguments) pairs, in the order to call them.
+            module: Module name where the functions are defined (default "houdini_test_functions").
+
+        Returns:
+            One result dictionary per call, in the same order as `calls`.
+        """
         with self.lock:
             if not self._ensure_started():
                 raise RuntimeError("Could not start hython process")
@@ -119,45 +201,54 @@ class HythonSession:
             if not self.process or not self.process.stdin or not self.process.stdout:
                 raise RuntimeError("Process pipes not available")
 
-            request = {
-                "module": module,
-                "function": func_name,
-                "args": [str(arg) for arg in args]
-            }
-
+            # Encode every request first, so an argument that can't be serialized
+            # fails the batch before any of it is sent.
+            requests = b''.join(
+                encode_frame({
+                    "module": module,
+                    "function": func_name,
+                    "args": list(args)
+                })
+                for func_name, args in calls
+            )
             try:
-                # Send request
-                request_line = json.dumps(request) + "\n"
-                self.process.stdin.write(request_line)
-                self.process.stdin.flush()
-
-                # Read response
-                if sys.platform == "win32":
-                    # On windows, select does not work with pipes, so we just accept
-                    # the possibility of a test hanging. If it becomes a problem,
-                    # test under WSL.
-                    pass
-                else:
-                    # Set timeout (e.g., 30 seconds)
-                    timeout = 30
-                    from select import select
-                    ready, _, _ = select([self.process.stdout], [], [], timeout)
-                    if not ready:
-                        self.close()
-                        raise RuntimeError("Timeout waiting for response from hython process")
-                response_line = self.process.stdout.readline().strip()
-                if not response_line:
-                    self.close()
-                    raise RuntimeError("No response from hython process")
-
-                try:
-                    return json.loads(response_line)
-                except json.JSONDecodeError as e:
-                    self.close()
-                    raise RuntimeError(f"Invalid JSON response from hython process: {response_line[:100]}") from e
-            except IOError as e:
+                # Send all the requests, then collect the responses
+                write_encoded(self.process.stdin, requests)
+                return [self._read_response() for _ in calls]
+            except (IOError, EOFError) as e:
                 self.close()  # Ensure we clean up the process on error so we start fresh next time
                 raise RuntimeError(f"Error communicating with hython process: {e}") from e
+            except BaseException:
+                # Unread responses would be handed to later calls; start fresh next time
+                self.close()
+                raise
+
+    def _read_response(self) -> HoudiniResult:
+        """Read the next response frame from the hython process."""
+        assert self.process and self.process.stdout
+        if sys.platform == "win32":
+            # On windows, select does not work with pipes, so we just accept
+            # the possibility of a test hanging. If it becomes a problem,
+            # test under WSL.
+            pass
+        else:
+            # Set timeout (e.g., 30 seconds)
+            timeout = 30
+            from select import select
+            ready, _, _ = select([self.process.stdout], [], [], timeout)
+            if not ready:
+                self.close()
+                raise RuntimeError("Timeout waiting for response from hython process")
+        try:
+            response = read_frame(self.process.stdout)
+        except ValueError as e:
+            # Not valid UTF-8 (UnicodeDecodeError) or not valid JSON (json.JSONDecodeError)
+            self.close()
+            raise RuntimeError(f"Invalid JSON response from hython process: {e}") from e
+        if response is None:
+            self.close()
+            raise RuntimeError("No response from hython process")
+        return response
 
     def close(self):
         """Close the hython process."""
@@ -165,9 +256,13 @@ class HythonSession:
             if self.process:
                 try:
                     if self.process.stdin:
-                        self.process.stdin.close()
+                        try:
+                            self.process.stdin.close()
+                        except BrokenPipeError:
+                            pass  # Worker already gone; still reap it below
+                    # The worker exits at once on SIGTERM, so don't wait long before killing it
                     self.process.terminate()
-                    self.process.wait(timeout=5)
+                    self.process.wait(timeout=0.5)
                 except subprocess.TimeoutExpired:
                     self.process.kill()
                     try:
@@ -181,6 +276,47 @@ class HythonSession:
                     self._started = False
 
 
+HYTHON_AVAILABLE: bool = HythonSession._find_hython() is not None
+"""Whether hython is on the PATH, so tests that need Houdini can run."""
+
+requires_hython = pytest.mark.skipif(
+    not HYTHON_AVAILABLE,
+    reason="hython not found - Houdini not installed or not in PATH",
+)
+"""
+Skip marker for tests that need hython.
+
+Added automatically at collection time (see `pytest_collection_modifyitems`)
+to integration tests and tests using the hython fixtures.
+"""
+
+hython_available_key = pytest.StashKey[bool]()
+"""`config.stash` key holding HYTHON_AVAILABLE, for plugins and hooks."""
+
+_HYTHON_FIXTURES = frozenset({"hython_test", "hython_batch", "hython_session"})
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Publish hython availability on the config stash."""
+    config.stash[hython_available_key] = HYTHON_AVAILABLE
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """
+    Mark tests that need hython as skipped up front when it is not installed.
+
+    This skips them without setting up fixtures, and keeps `--collect-only`
+    honest about what would run. The skip inside `hython_test` remains as
+    a safety net.
+    """
+    if config.stash[hython_available_key]:
+        return
+    for item in items:
+        if (item.get_closest_marker("integration")
+                or _HYTHON_FIXTURES.intersection(getattr(item, "fixturenames", ()))):
+            item.add_marker(requires_hython)
+
+
 @pytest.fixture(scope="session")
 def hython_session() -> Generator[HythonSession, None, None]:
     """Session-scoped fixture for persistent hython process."""
@@ -189,8 +325,7 @@ def hython_session() -> Generator[HythonSession, None, None]:
     session.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def houdini_available() -> bool:
     """Check if we're running in hython environment."""
-    executable = Path(sys.executable).name.lower()
-    return 'hython' in executable or 'houdini' in executable
+    return _HOUDINI_AVAILABLE
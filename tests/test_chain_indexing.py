@@ -0,0 +1,66 @@
+"""
+Tests for Chain indexing by integer, slice, and name.
+
+These tests use the hython_test fixture to run in Houdini environment.
+The indexing scenario is run once per module and shared by every test.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def chain_indexing(hython_test):
+    """Results of the chain indexing scenario, run once in hython."""
+    result = hython_test("test_chain_indexing")
+
+    assert result['success'] is True
+    assert 'result' in result
+    return result['result']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("index, expected_name", [
+    ("0", "source"),
+    ("1", "transform"),
+    ("2", "refine"),
+    ("-1", "refine"),
+])
+def test_chain_indexing_by_integer(chain_indexing, index, expected_name):
+    """Integer (including negative) indexes return the node at that position."""
+    assert chain_indexing["index_names"][index] == expected_name
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("name, expected_type", [
+    ("source", "box"),
+    ("transform", "xform"),
+    ("refine", "subdivide"),
+])
+def test_chain_indexing_by_name(chain_indexing, name, expected_type):
+    """Name indexes return the node with that name."""
+    assert chain_indexing["name_types"][name] == expected_type
+
+
+@pytest.mark.integration
+def test_chain_indexing_name_matches_integer(chain_indexing):
+    """Name and integer lookups return the same NodeInstance."""
+    assert chain_indexing["name_matches_index"] is True
+
+
+@pytest.mark.integration
+def test_chain_indexing_repeated_name(chain_indexing):
+    """When names repeat, name lookup returns the first matching node."""
+    assert chain_indexing["repeated_name_is_first"] is True
+
+
+@pytest.mark.integration
+def test_chain_indexing_by_slice(chain_indexing):
+    """Slices return a Chain of the selected nodes."""
+    assert chain_indexing["slice_names"] == ["transform", "refine"]
+
+
+@pytest.mark.integration
+def test_chain_invalid_indexing(chain_indexing):
+    """Unknown names raise KeyError; unsupported key types raise TypeError."""
+    assert "No node found with name 'missing'" in chain_indexing["missing_name_error"]
+    assert "Chain indices must be integers, slices, or strings" in chain_indexing["invalid_key_error"]
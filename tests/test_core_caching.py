@@ -122,6 +122,31 @@ class TestChainCopy:
         assert result_data["second_is_node_instance"] is True
 
 
+class TestCopyModuleProtocol:
+    """Test copy.copy() and copy.deepcopy() support."""
+
+    @pytest.mark.integration
+    def test_copy_module_uses_copy_methods(self, hython_test):
+        """copy.copy()/copy.deepcopy() should behave like NodeInstance.copy()/Chain.copy()."""
+        result = hython_test("test_copy_module_protocol")
+
+        assert result['success'] is True
+        assert 'result' in result
+        result_data = result['result']
+        assert result_data["node_copies_independent"] is True
+        assert result_data["node_copies_same_name"] is True
+        assert result_data["node_copies_same_attributes"] is True
+        assert result_data["chain_copies_independent"] is True
+        assert result_data["chain_nodes_copied"] is True
+        assert result_data["chain_names"] == ["proto_first", "proto_second"]
+        assert result_data["chain_nodes_rebound"] is True
+        assert result_data["shallow_chain_creates_new_nodes"] is True
+        assert result_data["deep_chain_creates_new_nodes"] is True
+        assert result_data["wrapped_has_node"] is True
+        assert result_data["wrapped_copies_drop_node"] is True
+        assert result_data["empty_chain_copy_length"] == 0
+
+
 class TestChainCreateBehavior:
     """Test Chain.create() new return behavior."""
 
@@ -154,18 +179,22 @@ class TestChainCreateBehavior:
 class TestChainConvenienceMethods:
     """Test Chain convenience methods for accessing created hou.Node instances."""
 
-    @pytest.mark.integration
-    def test_convenience_methods_with_created_nodes(self, hython_test):
-        """Test all Chain convenience methods work correctly."""
+    @pytest.fixture(scope="class")
+    def convenience_methods(self, hython_test):
+        """Results of the convenience methods scenario, run once for the class."""
         result = hython_test("test_chain_convenience_methods")
 
         assert result['success'] is True
         assert 'result' in result
-        result_data = result['result']
-        assert result_data["first_last_different"] is True
-        assert result_data["all_nodes_length"] == 3
-        assert result_data["nodes_iter_length"] == 3
-        assert len(result_data["all_nodes_paths"]) == 3
+        return result['result']
+
+    @pytest.mark.integration
+    def test_convenience_methods_with_created_nodes(self, convenience_methods):
+        """Test all Chain convenience methods work correctly."""
+        assert convenience_methods["first_last_different"] is True
+        assert convenience_methods["all_nodes_length"] == 3
+        assert convenience_methods["nodes_iter_length"] == 3
+        assert len(convenience_methods["all_nodes_paths"]) == 3
 
     @pytest.mark.integration
     def test_convenience_methods_empty_chain(self, hython_test):
@@ -181,17 +210,18 @@ class TestChainConvenienceMethods:
         assert "Cannot get last node of empty chain" in result_data["last_error"]
 
     @pytest.mark.integration
-    def test_convenience_methods_single_node(self, hython_test):
+    def test_convenience_methods_single_node(self, convenience_methods):
         """Test convenience methods with single-node chain."""
-        # This would need a separate test function - skipping for now to keep focused
-        pass
+        assert convenience_methods["single_first_is_last"] is True
+        assert convenience_methods["single_all_nodes_length"] == 1
+        assert convenience_methods["single_path"].endswith("only_box")
 
     @pytest.mark.integration
-    def test_create_caching_consistency(self, hython_test):
+    def test_create_caching_consistency(self, convenience_methods):
         """Test that Chain.create() returns same instances on repeated calls."""
-        # This would require a more complex test function - the current architecture
-        # handles caching automatically via @functools.cache
-        pass
+        assert convenience_methods["create_cached"] is True
+        assert convenience_methods["created_are_chain_nodes"] is True
+        assert convenience_methods["first_node_cached"] is True
 
 
 class TestNodeRegistry:
@@ -231,7 +261,3 @@ class TestMergeInputsFunction:
         assert result_data["multi_position_correct"] is True
         assert result_data["empty_lists_work"] is True
         assert result_data["one_empty_works"] is True
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
@@ -52,11 +52,29 @@ def test_multiple_input_merge(hython_test):
     assert validation_data['merge_inputs'] >= 2, "Merge node should have multiple inputs"
 
 
-@pytest.mark.parametrize("node_type", ["box", "sphere", "tube", "grid"])
-def test_geometry_creation(hython_test, node_type):
+GEOMETRY_TYPES = ["box", "sphere", "tube", "grid"]
+
+
+@pytest.fixture(scope="module")
+def geometry_creation(hython_batch):
+    """Create every geometry type in one pipelined batch, in GEOMETRY_TYPES order."""
+    return hython_batch([("test_geometry_node_creation", (node_type,)) for node_type in GEOMETRY_TYPES])
+
+
+def test_geometry_batch_results_in_order(geometry_creation):
+    """Each call in a batch gets its own result, in the order the calls were sent."""
+    assert len(geometry_creation) == len(GEOMETRY_TYPES)
+    assert [result['result'].get('node_type') for result in geometry_creation] == GEOMETRY_TYPES
+    assert [result['result'].get('node_path', '').rsplit('/', 1)[-1] for result in geometry_creation] == [
+        f"test_{node_type}_node" for node_type in GEOMETRY_TYPES
+    ]
+
+
+@pytest.mark.parametrize("index, node_type", enumerate(GEOMETRY_TYPES))
+def test_geometry_creation(geometry_creation, index, node_type):
     """Test creation of various geometry types."""
 
-    result = hython_test("test_geometry_node_creation", node_type)
+    result = geometry_creation[index]
 
     assert result['success']
 
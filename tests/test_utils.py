@@ -0,0 +1,82 @@
+"""
+Tests for the shared utilities in zabob_houdini.utils.
+"""
+
+import io
+import json
+
+import pytest
+
+from zabob_houdini.utils import FRAME_HEADER, encode_frame, read_frame, write_encoded, write_frame
+
+
+@pytest.mark.unit
+def test_frame_round_trip():
+    """Frames written back-to-back are read back one message at a time."""
+    stream = io.BytesIO()
+    write_frame(stream, {"module": "houdini_test_functions", "function": "test_hou_available", "args": []})
+    write_frame(stream, {"success": True, "result": {"message": "café\nline two"}})
+    stream.seek(0)
+
+    assert read_frame(stream) == {"module": "houdini_test_functions", "function": "test_hou_available", "args": []}
+    assert read_frame(stream) == {"success": True, "result": {"message": "café\nline two"}}
+    assert read_frame(stream) is None
+
+
+@pytest.mark.unit
+def test_frame_header_is_payload_length():
+    """The header is the big-endian byte length of the UTF-8 JSON payload."""
+    stream = io.BytesIO()
+    write_frame(stream, {"name": "café"})
+
+    data = stream.getvalue()
+    (size,) = FRAME_HEADER.unpack(data[:FRAME_HEADER.size])
+    assert size == len(data) - FRAME_HEADER.size
+    assert json.loads(data[FRAME_HEADER.size:]) == {"name": "café"}
+
+
+@pytest.mark.unit
+def test_encoded_frames_written_together():
+    """Frames encoded up front and written in one call read back like write_frame's."""
+    messages = [{"function": "first", "args": []}, {"function": "second", "args": [1, "two"]}]
+    stream = io.BytesIO()
+    write_encoded(stream, b"".join(encode_frame(message) for message in messages))
+    stream.seek(0)
+
+    assert [read_frame(stream) for _ in messages] == messages
+    assert read_frame(stream) is None
+
+
+@pytest.mark.unit
+def test_encode_frame_unserializable():
+    """Encoding fails on its own, before anything could be written."""
+    with pytest.raises(TypeError):
+        encode_frame({"args": [object()]})
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("truncate_to", [2, FRAME_HEADER.size + 3])
+def test_read_frame_truncated(truncate_to):
+    """A stream that ends partway through a frame is an error, not end of file."""
+    stream = io.BytesIO()
+    write_frame(stream, {"success": True, "result": {}})
+
+    with pytest.raises(EOFError):
+        read_frame(io.BytesIO(stream.getvalue()[:truncate_to]))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("bad, error", [
+    (b"{not json", json.JSONDecodeError),
+    (b'"\xff"', UnicodeDecodeError),
+], ids=["invalid_json", "invalid_utf8"])
+def test_read_frame_invalid_payload_keeps_framing(bad, error):
+    """An undecodable payload fails alone; the next frame is still readable."""
+    stream = io.BytesIO(FRAME_HEADER.pack(len(bad)) + bad)
+    stream.seek(0, io.SEEK_END)
+    write_frame(stream, {"success": True, "result": {}})
+    stream.seek(0)
+
+    with pytest.raises(error):
+        read_frame(stream)
+    assert read_frame(stream) == {"success": True, "result": {}}